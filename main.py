@@ -1,9 +1,65 @@
-import mysql.connector as sql
+from contextlib import contextmanager
 import datetime as dt
 import sys
 import getpass 
-import hashlib
+import os
+import re
+import math
 import logging
+import logging.handlers
+import queue
+import atexit
+import itertools
+import csv
+import io
+import time
+
+# Rows per multi-row INSERT. A batched statement must fit in the server's
+# max_allowed_packet (64MB default on MySQL 8, 4MB on older servers), so
+# raise that setting before increasing this value.
+BULK_CHUNK_SIZE = 500
+
+# Column order for CSV imports that have no header row
+EMPLOYEE_CSV_FIELDS = ['employee_id', 'name', 'department', 'position', 'salary', 'age', 'email']
+
+# Rows formatted per stdout write when listing employees
+OUTPUT_BATCH_SIZE = 1000
+
+DB_NAME = 'employee_management'
+POOL_SIZE = 10
+
+# Bump when initialize_tables() gains new DDL so existing databases migrate
+SCHEMA_VERSION = 1
+
+# Secondary indexes backing the filtered/sorted employee listing
+EMPLOYEE_INDEXES = {'ix_emp_dept': 'department', 'ix_emp_salary': 'salary'}
+
+# Columns view_all_employees() may sort by
+EMPLOYEE_SORT_COLUMNS = {'employee_id', 'salary', 'age'}
+
+# Seconds a successful login is remembered before the database is asked again
+USER_CACHE_TTL = 60
+
+# scrypt parameters; stored hashes are hex(salt || key), 96 characters
+SALT_BYTES = 16
+LEGACY_HASH_LENGTH = 64  # hex SHA-256 digests written before the scrypt migration
+SCRYPT_PARAMS = dict(n=2**14, r=8, p=1, dklen=32)
+
+# Successful password checks remembered so repeat logins skip the KDF
+VERIFY_CACHE_SIZE = 256
+
+# MySQL driver module, imported on first connect so the CLI starts quickly
+sql = None
+
+def load_driver():
+    """Import mysql.connector on first use and return it"""
+    global sql
+    if sql is None:
+        import mysql.connector
+        import mysql.connector.errorcode
+        import mysql.connector.pooling
+        sql = mysql.connector
+    return sql
 
 # =============================================
 # MODULE 1: DATABASE MANAGEMENT
@@ -13,74 +69,163 @@ class DatabaseManager:
     """Handles all database operations and connection management"""
     
     def __init__(self):
-        self.connection = None
-        self.cursor = None
+        self.pool = None
         self.setup_logging()
     
     def setup_logging(self):
         """Setup system logging for monitoring"""
+        # Callers only enqueue records; a background listener formats and writes them
+        log_queue = queue.Queue(-1)
+        file_handler = logging.FileHandler('system.log')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        self.log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop)
+        
+        # Timestamp and level are added by the file handler on the listener side
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[logging.FileHandler('system.log')]
+            format='%(message)s',
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
         self.logger = logging.getLogger(__name__)
     
     def connect_database(self, host='localhost', user='root'):
         """Establish secure database connection"""
+        load_driver()
         try:
             db_pw = getpass.getpass("Enter your MySQL 'root' password: ")
-            self.connection = sql.connect(host=host, user=user, passwd=db_pw)
-            self.cursor = self.connection.cursor()
-            self.logger.info("Database connection established")
+            # C-extension protocol when available; executemany() on a plain
+            # "VALUES (%s, ...)" INSERT is rewritten into one multi-row packet
+            if not sql.HAVE_CEXT:
+                self.logger.warning("MySQL C extension not available, using pure Python protocol")
+            options = dict(
+                host=host, user=user, passwd=db_pw,
+                use_pure=not sql.HAVE_CEXT, autocommit=False, compress=False
+            )
+            
+            # Pooled connections are bound to the schema, so make sure it exists first
+            bootstrap = sql.connect(**options)
+            try:
+                bootstrap.cursor().execute(f"CREATE DATABASE IF NOT EXISTS {DB_NAME}")
+            finally:
+                bootstrap.close()
+            
+            self.pool = sql.pooling.MySQLConnectionPool(
+                pool_name="ems", pool_size=POOL_SIZE, pool_reset_session=True,
+                database=DB_NAME, **options
+            )
+            self.logger.info("Database connection pool established")
             print("✓ Database connected successfully")
             return True
         except sql.Error as e:
             print(f"✗ Database connection failed: {e}")
             return False
     
+    @contextmanager
+    def acquire(self, **cursor_options):
+        """Borrow a pooled connection and cursor for one operation"""
+        conn = self.pool.get_connection()
+        try:
+            cur = conn.cursor(**cursor_options)
+            try:
+                yield conn, cur
+            finally:
+                cur.close()
+        finally:
+            conn.close()  # returns the connection to the pool
+    
+    @contextmanager
+    def transaction(self, **cursor_options):
+        """Borrow a connection and commit its work as a single unit"""
+        with self.acquire(**cursor_options) as (conn, cur):
+            try:
+                yield conn, cur
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def close_database(self):
+        """Close all idle pooled connections"""
+        if self.pool:
+            # MySQLConnectionPool has no public close-all call; _remove_connections()
+            # is present in every mysql-connector-python release up to the 9.x line
+            # pinned in the README, so recheck it when raising that pin
+            self.pool._remove_connections()
+            self.pool = None
+            self.logger.info("Database connection pool closed")
+    
     def initialize_tables(self):
         """Create database schema with proper design"""
         try:
-            self.cursor.execute("CREATE DATABASE IF NOT EXISTS employee_management")
-            self.cursor.execute("USE employee_management")
-            
-            # Employees table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS employees (
-                    employee_id INT PRIMARY KEY,
-                    name VARCHAR(100) NOT NULL,
-                    department VARCHAR(50),
-                    position VARCHAR(50),
-                    salary DECIMAL(12, 2),
-                    age INT,
-                    join_date DATE,
-                    email VARCHAR(100)
-                )
-            """)
-            
+            with self.acquire() as (conn, cur):
+                current_version = self.get_schema_version(cur)
+                # DDL takes metadata locks and commits implicitly, so skip it when current
+                if current_version >= SCHEMA_VERSION:
+                    self.logger.info(f"Database schema already at version {current_version}")
+                    return True
+                
+                # Employees table
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS employees (
+                        employee_id INT PRIMARY KEY,
+                        name VARCHAR(100) NOT NULL,
+                        department VARCHAR(50),
+                        position VARCHAR(50),
+                        salary DECIMAL(12, 2),
+                        age INT,
+                        join_date DATE,
+                        email VARCHAR(100)
+                    )
+                """)
+                
 
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS performance (
-                    record_id INT AUTO_INCREMENT PRIMARY KEY,
-                    employee_id INT,
-                    performance_rating INT,
-                    comments TEXT,
-                    review_date DATE,
-                    FOREIGN KEY (employee_id) REFERENCES employees(employee_id)
-                )
-            """)
-            
-         
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    username VARCHAR(50) PRIMARY KEY,
-                    password_hash VARCHAR(64) NOT NULL,
-                    role VARCHAR(20) DEFAULT 'employee'
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS performance (
+                        record_id INT AUTO_INCREMENT PRIMARY KEY,
+                        employee_id INT,
+                        performance_rating INT,
+                        comments TEXT,
+                        review_date DATE,
+                        FOREIGN KEY (employee_id) REFERENCES employees(employee_id)
+                    )
+                """)
+                
+             
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS users (
+                        username VARCHAR(50) PRIMARY KEY,
+                        password_hash VARCHAR(96) NOT NULL,
+                        role VARCHAR(20) DEFAULT 'employee'
+                    )
+                """)
+                # Widen the column on databases created with SHA-256 hashes
+                cur.execute("ALTER TABLE users MODIFY password_hash VARCHAR(96) NOT NULL")
+                
+                # MySQL has no CREATE INDEX IF NOT EXISTS, so add only the missing ones
+                cur.execute(
+                    "SELECT DISTINCT index_name FROM information_schema.statistics "
+                    "WHERE table_schema = DATABASE() AND table_name = 'employees'"
                 )
-            """)
-            
-            self.connection.commit()
+                existing = {row[0] for row in cur.fetchall()}
+                for index_name, column in EMPLOYEE_INDEXES.items():
+                    if index_name not in existing:
+                        try:
+                            cur.execute(f"CREATE INDEX {index_name} ON employees ({column})")
+                        except sql.Error as e:
+                            # Another instance starting at the same time created it first
+                            if e.errno != sql.errorcode.ER_DUP_KEYNAME:
+                                raise
+                
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_version (
+                        id TINYINT PRIMARY KEY,
+                        version INT NOT NULL
+                    )
+                """)
+                cur.execute("REPLACE INTO schema_version (id, version) VALUES (1, %s)", (SCHEMA_VERSION,))
+                conn.commit()
             self.logger.info("Database tables initialized")
             print("✓ Database tables created successfully")
             return True
@@ -88,6 +233,17 @@ class DatabaseManager:
         except sql.Error as e:
             print(f"✗ Table creation failed: {e}")
             return False
+    
+    def get_schema_version(self, cur):
+        """Return the recorded schema version, or 0 before the first migration"""
+        try:
+            cur.execute("SELECT version FROM schema_version")
+        except sql.ProgrammingError as e:
+            if e.errno == sql.errorcode.ER_NO_SUCH_TABLE:
+                return 0
+            raise
+        row = cur.fetchone()
+        return row[0] if row else 0
 
 
 # MODULE 2: AUTHENTICATION MANAGEMENT  
@@ -98,10 +254,45 @@ class AuthManager:
     
     def __init__(self, db_manager):
         self.db = db_manager
+        self._user_cache = {}  # username -> (password_hash, expires_at)
+        # Successful verifications, keyed by an HMAC under a per-process secret so
+        # no plaintext password is kept: (stored_hash, fingerprint) -> True
+        self._verified = {}
+        self._verify_secret = os.urandom(32)
+    
+    @staticmethod
+    def derive_key(password, salt):
+        """Memory-hard scrypt key derivation"""
+        import hashlib
+        return hashlib.scrypt(password.encode(), salt=salt, **SCRYPT_PARAMS)
+    
+    def hash_password(self, password, salt=None):
+        """Secure salted password hashing"""
+        if salt is None:
+            salt = os.urandom(SALT_BYTES)
+        return (salt + self.derive_key(password, salt)).hex()
     
-    def hash_password(self, password):
-        """Secure password hashing"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def verify_password(self, password, stored_hash):
+        """Check a password against a stored hash in constant time"""
+        import hashlib
+        import hmac
+        # A repeat check of credentials that already verified skips the KDF
+        cache_key = (stored_hash, hmac.new(self._verify_secret, password.encode(), 'sha256').digest())
+        if cache_key in self._verified:
+            return True
+        
+        if len(stored_hash) == LEGACY_HASH_LENGTH:
+            # Legacy unsalted SHA-256 hash from before the scrypt migration
+            candidate = hashlib.sha256(password.encode()).hexdigest()
+        else:
+            candidate = self.hash_password(password, bytes.fromhex(stored_hash[:SALT_BYTES * 2]))
+        if not hmac.compare_digest(candidate, stored_hash):
+            return False
+        
+        if len(self._verified) >= VERIFY_CACHE_SIZE:
+            self._verified.pop(next(iter(self._verified)))  # drop the oldest entry
+        self._verified[cache_key] = True
+        return True
     
     def register_user(self):
         """User registration with validation"""
@@ -114,31 +305,51 @@ class AuthManager:
             print("✗ Username cannot be empty")
             return False
         
-        # Check existing user
-        self.db.cursor.execute("SELECT username FROM users WHERE username = %s", (username,))
-        if self.db.cursor.fetchone():
-            print("✗ Username already exists")
-            return False
+        # Check existing user before prompting, so taken names never pay for the KDF
+        with self.db.acquire() as (conn, cur):
+            cur.execute("SELECT username FROM users WHERE username = %s", (username,))
+            if cur.fetchone():
+                print("✗ Username already exists")
+                return False
         
         password = input("Enter password: ").strip()
         if len(password) < 4:
             print("✗ Password must be at least 4 characters")
             return False
         
-        hashed_pw = self.hash_password(password)
-        
         try:
-            self.db.cursor.execute(
-                "INSERT INTO users (username, password_hash) VALUES (%s, %s)",
-                (username, hashed_pw)
-            )
-            self.db.connection.commit()
+            with self.db.transaction() as (conn, cur):
+                cur.execute(
+                    "INSERT INTO users (username, password_hash) VALUES (%s, %s)",
+                    (username, self.hash_password(password))
+                )
+            self._user_cache.pop(username, None)
             print("✓ User registered successfully!")
             return True
+        except sql.IntegrityError as e:
+            # Taken by a concurrent registration since the check above
+            if e.errno == sql.errorcode.ER_DUP_ENTRY:
+                print("✗ Username already exists")
+            else:
+                print(f"✗ Registration failed: {e}")
+            return False
         except sql.Error as e:
             print(f"✗ Registration failed: {e}")
             return False
     
+    def upgrade_password_hash(self, username, password, legacy_hash):
+        """Replace a legacy SHA-256 hash with a salted scrypt hash, best effort"""
+        new_hash = self.hash_password(password)
+        try:
+            with self.db.transaction() as (conn, cur):
+                cur.execute("UPDATE users SET password_hash = %s WHERE username = %s", (new_hash, username))
+        except sql.Error as e:
+            # The login itself succeeded; retry the upgrade on a later login
+            self.db.logger.warning(f"Password hash upgrade failed for user {username}: {e}")
+            return legacy_hash
+        self.db.logger.info(f"Upgraded password hash for user {username}")
+        return new_hash
+    
     def login_user(self):
         """User authentication"""
         print("\n" + "="*40)
@@ -148,14 +359,20 @@ class AuthManager:
         username = input("Username: ").strip()
         password = input("Password: ").strip()
         
-        hashed_pw = self.hash_password(password)
-        
-        self.db.cursor.execute(
-            "SELECT username FROM users WHERE username = %s AND password_hash = %s",
-            (username, hashed_pw)
-        )
+        # Recent successful login skips the round-trip; the derived key is cached too
+        cached = self._user_cache.get(username)
+        if cached and cached[1] > time.monotonic():
+            stored_hash = cached[0]
+        else:
+            with self.db.acquire() as (conn, cur):
+                cur.execute("SELECT password_hash FROM users WHERE username = %s", (username,))
+                user = cur.fetchone()
+            stored_hash = user[0] if user else None
         
-        if self.db.cursor.fetchone():
+        if stored_hash and self.verify_password(password, stored_hash):
+            if len(stored_hash) == LEGACY_HASH_LENGTH:
+                stored_hash = self.upgrade_password_hash(username, password, stored_hash)
+            self._user_cache[username] = (stored_hash, time.monotonic() + USER_CACHE_TTL)
             print("✓ Login successful!")
             return True
         else:
@@ -166,87 +383,231 @@ class AuthManager:
 # MODULE 3: EMPLOYEE OPERATIONS
 # =============================================
 
+_EMP_ID_RE = re.compile(r"^\d+$")
+
+def _parse_employee_id(value):
+    """Validate an employee ID field and return it as an int"""
+    emp_id = str(value if value is not None else '').strip()
+    if not _EMP_ID_RE.match(emp_id):
+        raise ValueError("Invalid Employee ID")
+    return int(emp_id)
+
+def _parse_salary(value):
+    """Validate a salary field and return it as a float"""
+    try:
+        salary = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid input format. Please check your inputs.") from None
+    # float() accepts 'nan' and 'inf', which the DECIMAL column would reject
+    if not math.isfinite(salary) or salary < 0:
+        raise ValueError("Salary must be a non-negative number")
+    return salary
+
+def _parse_age(value):
+    """Validate an age field and return it as an int"""
+    try:
+        age = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid input format. Please check your inputs.") from None
+    if age < 18 or age > 65:
+        raise ValueError("Age must be between 18-65")
+    return age
+
+def _parse_employee_row(raw, join_date):
+    """Validate a raw employee record and return its INSERT parameters"""
+    emp_id = _parse_employee_id(raw.get('employee_id'))
+    salary = _parse_salary(raw.get('salary'))
+    age = _parse_age(raw.get('age'))
+    
+    name = str(raw.get('name') or '').strip()
+    department = str(raw.get('department') or '').strip()
+    if not name or not department:
+        raise ValueError("Name and department are required")
+    
+    return (emp_id, name, department, str(raw.get('position') or '').strip(),
+            salary, age, join_date, str(raw.get('email') or '').strip())
+
 class EmployeeOperations:
     """Handles all employee CRUD operations and reporting"""
     
     def __init__(self, db_manager):
         self.db = db_manager
+        self._emp_count = None  # cached COUNT(*), loaded on first use
     
     def add_employee(self):
         """Add new employee with validation"""
         print("\n--- ADD NEW EMPLOYEE ---")
         try:
-            emp_id = int(input("Employee ID: "))
-            name = input("Full Name: ").strip()
-            department = input("Department: ").strip()
-            position = input("Position: ").strip()
-            salary = float(input("Salary: "))
-            age = int(input("Age: "))
-            email = input("Email: ").strip()
-            
-            # Validate inputs
-            if not name or not department:
-                print("✗ Name and department are required")
-                return
-            
-            if age < 18 or age > 65:
-                print("✗ Age must be between 18-65")
-                return
-            
-            # Check duplicate ID
-            self.db.cursor.execute("SELECT employee_id FROM employees WHERE employee_id = %s", (emp_id,))
-            if self.db.cursor.fetchone():
-                print("✗ Employee ID already exists")
-                return
-            
-            # Insert employee
-            self.db.cursor.execute("""
-                INSERT INTO employees (employee_id, name, department, position, salary, age, join_date, email)
-                VALUES (%s, %s, %s, %s, %s, %s, CURDATE(), %s)
-            """, (emp_id, name, department, position, salary, age, email))
+            # Numeric fields are checked as they are typed, so a bad value stops the prompt early
+            raw = {'employee_id': _parse_employee_id(input("Employee ID: "))}
+            raw['name'] = input("Full Name: ")
+            raw['department'] = input("Department: ")
+            raw['position'] = input("Position: ")
+            raw['salary'] = _parse_salary(input("Salary: "))
+            raw['age'] = _parse_age(input("Age: "))
+            raw['email'] = input("Email: ")
+            record = _parse_employee_row(raw, dt.date.today())
             
-            self.db.connection.commit()
+            # Duplicate IDs are rejected by the primary key, saving a lookup query
+            with self.db.transaction() as (conn, cur):
+                cur.execute("""
+                    INSERT INTO employees (employee_id, name, department, position, salary, age, join_date, email)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """, record)
+            if self._emp_count is not None:
+                self._emp_count += 1
             print("✓ Employee added successfully!")
             
-        except ValueError:
-            print("✗ Invalid input format. Please check your inputs.")
+        except ValueError as e:
+            print(f"✗ {e}")
+        except sql.IntegrityError as e:
+            if e.errno == sql.errorcode.ER_DUP_ENTRY:
+                print("✗ Employee ID already exists")
+            else:
+                print(f"✗ Database error: {e}")
         except sql.Error as e:
             print(f"✗ Database error: {e}")
+
+    def add_employees_bulk(self, rows, chunk_size=BULK_CHUNK_SIZE, row_numbers=None):
+        """Insert many employees using one multi-row INSERT per chunk
+
+        row_numbers optionally gives each row's source line for error messages;
+        by default rows are numbered from 1.
+        """
+        # One join date for the whole batch, even if it runs past midnight
+        join_date = dt.date.today()
+        records = []  # (source row number, INSERT parameters)
+        for row_number, row in zip(row_numbers or itertools.count(1), rows):
+            try:
+                records.append((row_number, _parse_employee_row(row, join_date)))
+            except ValueError as e:
+                print(f"✗ Skipping row {row_number} (employee ID {row.get('employee_id')}): {e}")
+
+        def insert_sql(row_count):
+            return ("INSERT INTO employees (employee_id, name, department, position, salary, age, join_date, email) "
+                    "VALUES " + ", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s)"] * row_count))
+        
+        # The prepared cursor only skips re-preparing when it is handed the very
+        # same string object, so every full chunk shares one prebuilt statement
+        full_chunk_sql = insert_sql(chunk_size)
+        single_row_sql = insert_sql(1)
+        
+        inserted = 0
+        with self.db.acquire(prepared=True) as (conn, cur):
+            for start in range(0, len(records), chunk_size):
+                chunk = records[start:start + chunk_size]
+                operation = full_chunk_sql if len(chunk) == chunk_size else insert_sql(len(chunk))
+                try:
+                    cur.execute(operation, list(itertools.chain.from_iterable(record for _, record in chunk)))
+                    conn.commit()
+                    inserted += len(chunk)
+                    continue
+                except sql.Error as e:
+                    conn.rollback()
+                    emp_ids = [record[0] for _, record in chunk]
+                    print(f"✗ Batch of employee IDs {emp_ids[0]}..{emp_ids[-1]} failed ({e}); retrying row by row")
+                
+                # Only the offending rows are lost; the rest of the chunk is kept
+                for row_number, record in chunk:
+                    try:
+                        cur.execute(single_row_sql, record)
+                        inserted += 1
+                    except sql.Error as e:
+                        print(f"✗ Row {row_number} (employee ID {record[0]}) not inserted: {e}")
+                conn.commit()
+
+        if self._emp_count is not None:
+            self._emp_count += inserted
+        self.db.logger.info(f"Bulk inserted {inserted} employees")
+        print(f"✓ {inserted} employees added successfully!")
+        return inserted
+
+    def bulk_add_from_stdin(self):
+        """Import employees from CSV text piped or pasted on stdin"""
+        print("\n--- BULK IMPORT EMPLOYEES ---")
+        print(f"Enter CSV rows ({', '.join(EMPLOYEE_CSV_FIELDS)}), then press Ctrl-D to finish")
+        
+        # One read for the whole input instead of an input() prompt per field
+        reader = csv.reader(io.StringIO(sys.stdin.read().lstrip('\ufeff')))
+        first_row = next(reader, None)
+        if first_row is None:
+            print("✗ No rows provided")
+            return 0
+        
+        # A header names known columns, in any order; otherwise use the default order
+        header = [column.strip().lower() for column in first_row]
+        numbered_rows = []  # (input line number, row)
+        if set(header) <= set(EMPLOYEE_CSV_FIELDS):
+            fieldnames = header
+        else:
+            fieldnames = EMPLOYEE_CSV_FIELDS
+            numbered_rows.append((reader.line_num, first_row))
+        numbered_rows.extend((reader.line_num, row) for row in reader if row)
+        
+        return self.add_employees_bulk(
+            [dict(zip(fieldnames, row)) for _, row in numbered_rows],
+            row_numbers=[line_num for line_num, _ in numbered_rows]
+        )
     
-    def view_all_employees(self):
-        """Display all employees in formatted table"""
+    def view_all_employees(self, department=None, limit=None, order_by='employee_id', descending=False):
+        """Display employees in formatted table, optionally filtered, sorted and limited"""
+        if order_by not in EMPLOYEE_SORT_COLUMNS:
+            raise ValueError(f"Cannot sort employees by {order_by!r}")
+        
+        # Filtering, sorting and limiting happen in MySQL so only needed rows are sent
+        # Salary arrives as preformatted text, avoiding a Decimal per row; it is left
+        # unaliased so ORDER BY salary still sorts on the numeric column
+        query = ("SELECT employee_id, name, department, position, CAST(salary AS CHAR), age, email "
+                 "FROM employees")
+        params = []
+        if department is not None:
+            query += " WHERE department = %s"
+            params.append(department)
+        query += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(int(limit))
+        
         print("\n--- ALL EMPLOYEES ---")
-        self.db.cursor.execute("""
-            SELECT employee_id, name, department, position, salary, age, email 
-            FROM employees ORDER BY employee_id
-        """)
-        employees = self.db.cursor.fetchall()
+        format_row = "{:<6} {:<20} {:<15} {:<15} {:<12} {:<4} {:<25}\n".format
+        buffer = []
+        found = False
         
-        if not employees:
-            print("No employees found in database")
-            return
+        # Unbuffered cursor streams rows as they arrive instead of loading them all
+        with self.db.acquire(buffered=False) as (conn, cur):
+            cur.execute(query, params)
+            for emp in cur:
+                if not found:
+                    # Formatted table header
+                    print(f"{'ID':<6} {'Name':<20} {'Department':<15} {'Position':<15} {'Salary':<12} {'Age':<4} {'Email':<25}")
+                    print("-" * 100)
+                    found = True
+                buffer.append(format_row(*emp))
+                # Write in blocks rather than one print() call per row
+                if len(buffer) >= OUTPUT_BATCH_SIZE:
+                    sys.stdout.write("".join(buffer))
+                    buffer.clear()
         
-        # Formatted table header
-        print(f"{'ID':<6} {'Name':<20} {'Department':<15} {'Position':<15} {'Salary':<12} {'Age':<4} {'Email':<25}")
-        print("-" * 100)
+        sys.stdout.write("".join(buffer))
+        sys.stdout.flush()
         
-        for emp in employees:
-            emp_id, name, dept, position, salary, age, email = emp
-            print(f"{emp_id:<6} {name:<20} {dept:<15} {position:<15} {salary:<12.2f} {age:<4} {email:<25}")
+        if not found:
+            print("No employees found in database")
     
     def update_salary(self):
         """Update employee salary with percentage increase"""
         print("\n--- UPDATE SALARY ---")
         emp_id = input("Enter Employee ID: ").strip()
         
-        if not emp_id.isdigit():
+        if not _EMP_ID_RE.match(emp_id):
             print("✗ Invalid Employee ID")
             return
         
         try:
             # Check if employee exists
-            self.db.cursor.execute("SELECT name, salary FROM employees WHERE employee_id = %s", (int(emp_id),))
-            employee = self.db.cursor.fetchone()
+            with self.db.acquire() as (conn, cur):
+                cur.execute("SELECT name, salary FROM employees WHERE employee_id = %s", (int(emp_id),))
+                employee = cur.fetchone()
             
             if not employee:
                 print("✗ Employee not found")
@@ -258,11 +619,11 @@ class EmployeeOperations:
             increase_percent = float(input("Enter percentage increase (e.g., 10 for 10%): "))
             new_salary = current_salary * (1 + increase_percent/100)
             
-            self.db.cursor.execute(
-                "UPDATE employees SET salary = %s WHERE employee_id = %s",
-                (new_salary, int(emp_id))
-            )
-            self.db.connection.commit()
+            with self.db.transaction() as (conn, cur):
+                cur.execute(
+                    "UPDATE employees SET salary = %s WHERE employee_id = %s",
+                    (new_salary, int(emp_id))
+                )
             
             print(f"✓ Salary updated successfully! New salary: ${new_salary:.2f}")
             
@@ -271,11 +632,48 @@ class EmployeeOperations:
         except sql.Error as e:
             print(f"✗ Database error: {e}")
     
-    def view_employee_count(self):
+    def update_salaries_bulk(self, raises, chunk_size=BULK_CHUNK_SIZE):
+        """Apply percentage raises keyed by employee ID, one UPDATE per chunk"""
+        items = [(int(emp_id), 1 + float(percent) / 100) for emp_id, percent in raises.items()]
+        updated = 0
+        with self.db.transaction() as (conn, cur):
+            for start in range(0, len(items), chunk_size):
+                chunk = items[start:start + chunk_size]
+                cases = " ".join(["WHEN %s THEN %s"] * len(chunk))
+                id_list = ", ".join(["%s"] * len(chunk))
+                cur.execute(
+                    f"UPDATE employees SET salary = salary * CASE employee_id {cases} END "
+                    f"WHERE employee_id IN ({id_list})",
+                    list(itertools.chain.from_iterable(chunk)) + [emp_id for emp_id, _ in chunk]
+                )
+                updated += cur.rowcount
+        self.db.logger.info(f"Bulk salary update applied to {updated} employees")
+        return updated
+    
+    def update_department_salary(self, department, increase_percent):
+        """Apply the same percentage raise to every employee in a department"""
+        with self.db.transaction() as (conn, cur):
+            cur.execute(
+                "UPDATE employees SET salary = salary * %s WHERE department = %s",
+                (1 + float(increase_percent) / 100, department)
+            )
+            updated = cur.rowcount
+        self.db.logger.info(f"Salary raise of {increase_percent}% applied to {updated} employees in {department}")
+        return updated
+    
+    def refresh_count(self):
+        """Reload the cached employee count with an exact COUNT(*)"""
+        with self.db.acquire() as (conn, cur):
+            cur.execute("SELECT COUNT(*) FROM employees")
+            self._emp_count = cur.fetchone()[0]
+        return self._emp_count
+    
+    def view_employee_count(self, exact=False):
         """Display total employee count"""
-        self.db.cursor.execute("SELECT COUNT(*) FROM employees")
-        count = self.db.cursor.fetchone()[0]
-        print(f"\nTotal employees in system: {count}")
+        # The cached count only tracks inserts made by this session
+        if exact or self._emp_count is None:
+            self.refresh_count()
+        print(f"\nTotal employees in system: {self._emp_count}")
     
     def add_performance_review(self):
         """Add performance review for employee"""
@@ -289,18 +687,17 @@ class EmployeeOperations:
                 print("✗ Rating must be between 1-5")
                 return
             
-            # Verify employee exists
-            self.db.cursor.execute("SELECT name FROM employees WHERE employee_id = %s", (emp_id,))
-            if not self.db.cursor.fetchone():
+            # Inserts nothing when the employee does not exist
+            with self.db.transaction() as (conn, cur):
+                cur.execute("""
+                    INSERT INTO performance (employee_id, performance_rating, comments, review_date)
+                    SELECT %s, %s, %s, %s FROM employees WHERE employee_id = %s
+                """, (emp_id, rating, comments, dt.date.today(), emp_id))
+                inserted = cur.rowcount
+            
+            if not inserted:
                 print("✗ Employee ID not found")
                 return
-            
-            self.db.cursor.execute("""
-                INSERT INTO performance (employee_id, performance_rating, comments, review_date)
-                VALUES (%s, %s, %s, CURDATE())
-            """, (emp_id, rating, comments))
-            
-            self.db.connection.commit()
             print("✓ Performance review added successfully!")
             
         except ValueError:
@@ -308,6 +705,69 @@ class EmployeeOperations:
         except sql.Error as e:
             print(f"✗ Database error: {e}")
 
+    def add_performance_reviews_bulk(self, rows, chunk_size=BULK_CHUNK_SIZE):
+        """Insert (employee_id, rating, comments, review_date) rows in one transaction
+
+        Returns (inserted_count, rejected_rows); nothing is inserted if any row is rejected.
+        """
+        today = dt.date.today()
+        reviews = []
+        malformed = []
+        for row in rows:
+            try:
+                emp_id, rating, comments, review_date = row
+                reviews.append((int(emp_id), int(rating), comments, review_date or today))
+            except (TypeError, ValueError):
+                malformed.append(row)
+        if malformed:
+            print(f"✗ {len(malformed)} malformed review rows: {malformed}")
+            return 0, malformed
+        
+        invalid = [review for review in reviews if not 1 <= review[1] <= 5]
+        if invalid:
+            print(f"✗ Rating must be between 1-5 (employee IDs: {[review[0] for review in invalid]})")
+            return 0, invalid
+        
+        # executemany() on a plain VALUES list is sent as one multi-row INSERT;
+        # the foreign key replaces a per-row existence check
+        try:
+            with self.db.transaction() as (conn, cur):
+                for start in range(0, len(reviews), chunk_size):
+                    cur.executemany("""
+                        INSERT INTO performance (employee_id, performance_rating, comments, review_date)
+                        VALUES (%s, %s, %s, %s)
+                    """, reviews[start:start + chunk_size])
+        except sql.IntegrityError as e:
+            if e.errno != sql.errorcode.ER_NO_REFERENCED_ROW_2:
+                print(f"✗ Database error: {e}")
+                return 0, reviews
+            try:
+                missing = self._missing_employee_ids({review[0] for review in reviews})
+            except sql.Error as lookup_error:
+                print(f"✗ Database error: {lookup_error}")
+                return 0, reviews
+            print(f"✗ No reviews added, unknown employee IDs: {sorted(missing)}")
+            return 0, [review for review in reviews if review[0] in missing]
+        except sql.Error as e:
+            print(f"✗ Database error: {e}")
+            return 0, reviews
+        
+        self.db.logger.info(f"Bulk inserted {len(reviews)} performance reviews")
+        print(f"✓ {len(reviews)} performance reviews added successfully!")
+        return len(reviews), []
+    
+    def _missing_employee_ids(self, emp_ids):
+        """Return the subset of emp_ids with no matching employee"""
+        emp_ids = sorted(emp_ids)
+        with self.db.acquire() as (conn, cur):
+            cur.execute(
+                "SELECT employee_id FROM employees WHERE employee_id IN ("
+                + ", ".join(["%s"] * len(emp_ids)) + ")",
+                emp_ids
+            )
+            existing = {row[0] for row in cur.fetchall()}
+        return set(emp_ids) - existing
+
 # =============================================
 # MAIN APPLICATION & MENU SYSTEM
 # =============================================
@@ -324,6 +784,7 @@ def display_main_menu():
     print("4. View Employee Count")
     print("5. Add Performance Review")
     print("6. Logout")
+    print("7. Bulk Import CSV")
     print("="*50)
 
 def main():
@@ -374,7 +835,7 @@ def main():
         display_main_menu()
         
         try:
-            choice = int(input("\nEnter your choice (1-6): "))
+            choice = int(input("\nEnter your choice (1-7): "))
             
             if choice == 1:
                 emp_operations.add_employee()
@@ -383,25 +844,30 @@ def main():
             elif choice == 3:
                 emp_operations.update_salary()
             elif choice == 4:
-                emp_operations.view_employee_count()
+                emp_operations.view_employee_count(exact='--exact' in sys.argv)
             elif choice == 5:
                 emp_operations.add_performance_review()
             elif choice == 6:
                 print("\nThank you for using Employee Management System!")
                 break
+            elif choice == 7:
+                emp_operations.bulk_add_from_stdin()
             else:
-                print("✗ Please enter a number between 1-6")
+                print("✗ Please enter a number between 1-7")
                 
         except ValueError:
             print("✗ Invalid input. Please enter a number.")
         except KeyboardInterrupt:
             print("\n\nSystem interrupted by user. Goodbye!")
             break
+        except EOFError:
+            # Piped input exhausted, e.g. after a scripted bulk import
+            print("\nEnd of input. Goodbye!")
+            break
     
     # Cleanup
-    if db_manager.connection and db_manager.connection.is_connected():
-        db_manager.cursor.close()
-        db_manager.connection.close()
+    if db_manager.pool:
+        db_manager.close_database()
         print("Database connection closed.")
 
 if __name__ == "__main__":